@@ -2,7 +2,25 @@ import streamlit as st
 
 from src.summariser import NewsSummariser
 from summarise_url import fetch_page_text
-from news_digest import RSS_FEEDS, fetch_feed_items
+from news_digest import (
+    RSS_FEEDS,
+    fetch_all_feeds,
+    fetch_all_page_texts,
+    filter_items,
+    merge_feed_items,
+)
+
+
+@st.cache_resource
+def get_summariser() -> NewsSummariser:
+    """
+    Load the summarisation model once per Streamlit process.
+
+    Streamlit re-runs the whole script on every interaction, so without
+    caching we would reload the model on every button click. The model is
+    warmed up here so the first user request doesn't pay the cold-start cost.
+    """
+    return NewsSummariser(warmup=True)
 
 
 def render_url_mode() -> None:
@@ -21,6 +39,11 @@ def render_url_mode() -> None:
         step=50,
     )
 
+    fast_mode = st.checkbox(
+        "Fast mode (bullets from TL;DR)",
+        help="Skip the second model pass and split the TL;DR into bullet points instead.",
+    )
+
     if st.button("Summarise URL"):
         if not url.strip():
             st.warning("Please enter a URL.")
@@ -37,8 +60,12 @@ def render_url_mode() -> None:
                 st.error("Could not extract any text from the page.")
                 return
 
-            summariser = NewsSummariser()
-            result = summariser.summarise(page_text, max_chars=max_chars)
+            summariser = get_summariser()
+            result = summariser.summarise(
+                page_text,
+                max_chars=max_chars,
+                bullets_mode="sentences" if fast_mode else "model",
+            )
 
         st.subheader("TL;DR")
         st.write(result.tldr)
@@ -68,6 +95,12 @@ def render_file_mode() -> None:
         key="file_max_chars",
     )
 
+    fast_mode = st.checkbox(
+        "Fast mode (bullets from TL;DR)",
+        help="Skip the second model pass and split the TL;DR into bullet points instead.",
+        key="file_fast_mode",
+    )
+
     if st.button("Summarise file"):
         if uploaded_file is None:
             st.warning("Please upload a file first.")
@@ -87,8 +120,12 @@ def render_file_mode() -> None:
             return
 
         with st.spinner("Summarising file..."):
-            summariser = NewsSummariser()
-            result = summariser.summarise(text, max_chars=max_chars)
+            summariser = get_summariser()
+            result = summariser.summarise(
+                text,
+                max_chars=max_chars,
+                bullets_mode="sentences" if fast_mode else "model",
+            )
 
         st.subheader("TL;DR")
         st.write(result.tldr)
@@ -127,6 +164,12 @@ def render_digest_mode() -> None:
         key="digest_max_chars",
     )
 
+    fast_mode = st.checkbox(
+        "Fast mode (bullets from TL;DR)",
+        help="Skip the second model pass and split the TL;DR into bullet points instead.",
+        key="digest_fast_mode",
+    )
+
     if st.button("Run news digest"):
         query_clean = (query or "").strip()
         if not query_clean:
@@ -136,18 +179,10 @@ def render_digest_mode() -> None:
         st.write(f"Searching news feeds for: **{query_clean!r}**")
 
         with st.spinner("Fetching feeds and searching for matching items..."):
-            # Collect items from all feeds (reuse your RSS_FEEDS + fetch_feed_items)
-            all_items = []
-            for feed_url in RSS_FEEDS:
-                items = fetch_feed_items(feed_url)
-                all_items.extend(items)
-
-            query_lower = query_clean.lower()
-            matching_items = []
-            for item in all_items:
-                haystack = (item.get("title", "") + " " + item.get("description", "")).lower()
-                if query_lower in haystack:
-                    matching_items.append(item)
+            # Collect items from all feeds (fetched concurrently)
+            all_items = merge_feed_items(fetch_all_feeds(RSS_FEEDS))
+
+            matching_items = filter_items(all_items, query_clean)
 
         if not matching_items:
             st.info(
@@ -155,36 +190,44 @@ def render_digest_mode() -> None:
                 f"in the current feeds. Try a broader term (e.g. 'UK', 'police', 'election')."
             )
             # Optional: show a few recent titles so user sees what's there
-            if all_items:
+            if all_items["titles"]:
                 st.write("Here are a few recent headlines from the feeds:")
-                for item in all_items[:5]:
-                    st.markdown(f"- {item.get('title', '').strip()}")
+                for title in all_items["titles"][:5]:
+                    st.markdown(f"- {title.strip()}")
             return
 
         st.success(f"Found {len(matching_items)} matching items. Showing up to {max_articles}.")
 
-        summariser = NewsSummariser()
+        summariser = get_summariser()
+
+        selected_items = matching_items[:max_articles]
+        with st.spinner("Fetching articles..."):
+            links = [all_items["links"][idx].strip() for idx in selected_items]
+            page_results = fetch_all_page_texts(links)
 
-        for i, item in enumerate(matching_items[:max_articles], start=1):
-            title = item.get("title", "").strip()
-            link = item.get("link", "").strip()
+        for i, (idx, link, (page_text, fetch_error)) in enumerate(
+            zip(selected_items, links, page_results), start=1
+        ):
+            title = all_items["titles"][idx].strip()
 
             with st.expander(f"Article {i}: {title}", expanded=(i == 1)):
                 if link:
                     st.markdown(f"[Read full article]({link})")
 
-                with st.spinner("Fetching and summarising article..."):
-                    try:
-                        page_text = fetch_page_text(link) if link else ""
-                    except Exception as e:
-                        st.error(f"Error fetching article text: {e}")
+                with st.spinner("Summarising article..."):
+                    if fetch_error is not None:
+                        st.error(f"Error fetching article text: {fetch_error}")
                         continue
 
                     if not page_text:
                         st.error("Could not extract text from this article.")
                         continue
 
-                    result = summariser.summarise(page_text, max_chars=max_chars)
+                    result = summariser.summarise(
+                        page_text,
+                        max_chars=max_chars,
+                        bullets_mode="sentences" if fast_mode else "model",
+                    )
 
                 st.subheader("TL;DR")
                 st.write(result.tldr)
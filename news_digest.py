@@ -1,13 +1,18 @@
 #!/usr/bin/env python
 
 import argparse
-from typing import List, Dict
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, List, Dict, Optional, Tuple
 
-import requests
 from bs4 import BeautifulSoup
 
 from src.summariser import NewsSummariser
-from summarise_url import fetch_page_text
+from summarise_url import SESSION, fetch_page_text
 
 
 # Simple list of RSS/Atom feeds to query.
@@ -22,29 +27,110 @@ RSS_FEEDS: List[str] = [
     "https://feeds.bbci.co.uk/news/world/middle_east/rss.xml",    # Middle East
 ]
 
+# On-disk cache of parsed feeds, keyed by feed URL. Each entry keeps the
+# ETag / Last-Modified headers from the last response, so the next fetch can
+# be a conditional GET; on "304 Not Modified" we reuse the stored items.
+FEED_CACHE_PATH = Path(".feed_cache.json")
 
-def fetch_feed_items(feed_url: str) -> List[Dict[str, str]]:
+_feed_cache: Optional[Dict[str, Dict[str, Any]]] = None
+_feed_cache_lock = threading.Lock()  # feeds are fetched from several threads
+
+
+def _get_feed_cache() -> Dict[str, Dict[str, Any]]:
+    # Must be called with _feed_cache_lock held.
+    global _feed_cache
+    if _feed_cache is None:
+        try:
+            _feed_cache = json.loads(FEED_CACHE_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _feed_cache = {}
+    return _feed_cache
+
+
+def _save_feed_cache() -> None:
+    # Must be called with _feed_cache_lock held.
+    # Write to a uniquely named temp file and swap it in, so several
+    # processes (e.g. the CLI and Streamlit) never write the same temp file.
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=FEED_CACHE_PATH.parent,
+            prefix=FEED_CACHE_PATH.name,
+            suffix=".tmp",
+            delete=False,
+        ) as tmp_file:
+            json.dump(_get_feed_cache(), tmp_file)
+        os.replace(tmp_file.name, FEED_CACHE_PATH)
+    except OSError as e:
+        print(f"[warning] Failed to write feed cache {FEED_CACHE_PATH}: {e}")
+
+
+# Feed items are stored as a structure of arrays: parallel lists indexed by
+# item position. Keys: "titles", "links", "descriptions", "haystacks".
+FeedItems = Dict[str, List[str]]
+
+
+def empty_feed_items() -> FeedItems:
+    return {"titles": [], "links": [], "descriptions": [], "haystacks": []}
+
+
+def merge_feed_items(feeds: List[FeedItems]) -> FeedItems:
+    """
+    Concatenate the items of several feeds into one FeedItems.
+    """
+    merged = empty_feed_items()
+    for feed in feeds:
+        for key, values in merged.items():
+            values.extend(feed[key])
+    return merged
+
+
+def fetch_feed_items(feed_url: str) -> FeedItems:
     """
     Fetch items from an RSS/Atom feed URL.
 
-    Returns a list of dicts, each with:
-      - title
-      - link
-      - description
+    Returns parallel lists (one entry per item):
+      - titles
+      - links
+      - descriptions
+      - haystacks (lowercased title + description, used for keyword search)
 
     This is a simple parser using BeautifulSoup on the XML.
+    Unchanged feeds (HTTP 304) are served from FEED_CACHE_PATH without parsing.
     """
+    with _feed_cache_lock:
+        cached = _get_feed_cache().get(feed_url)
+
+    # Entries from older versions stored a list of item dicts; treat anything
+    # that is not in the current FeedItems layout as a cache miss.
+    if cached and not isinstance(cached.get("items"), dict):
+        cached = None
+
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
     try:
-        response = requests.get(feed_url, timeout=10)
+        response = SESSION.get(feed_url, headers=headers, timeout=10)
         response.raise_for_status()
     except Exception as e:
+        if cached:
+            print(f"[warning] Failed to fetch feed {feed_url}: {e} (using cached copy)")
+            return cached["items"]
         print(f"[warning] Failed to fetch feed {feed_url}: {e}")
-        return []
+        return empty_feed_items()
+
+    if response.status_code == 304 and cached:
+        return cached["items"]
 
     xml = response.text
     soup = BeautifulSoup(xml, "xml")  # parse as XML
 
-    items: List[Dict[str, str]] = []
+    items = empty_feed_items()
 
     # Typical RSS uses <item>; Atom often uses <entry>.
     # We'll try both.
@@ -65,16 +151,80 @@ def fetch_feed_items(feed_url: str) -> List[Dict[str, str]]:
         if not title and not description:
             continue
 
-        items.append(
-            {
-                "title": title,
-                "link": link,
-                "description": description,
+        items["titles"].append(title)
+        items["links"].append(link)
+        items["descriptions"].append(description)
+        # Lowercase once here rather than on every search.
+        items["haystacks"].append((title + " " + description).lower())
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        with _feed_cache_lock:
+            _get_feed_cache()[feed_url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "items": items,
             }
-        )
+            _save_feed_cache()
 
     return items
 
+
+def filter_items(items: FeedItems, query: str) -> List[int]:
+    """
+    Return the indices of the items whose title or description contains
+    `query` (case-insensitive).
+    """
+    query_lower = query.lower()
+    return [i for i, haystack in enumerate(items["haystacks"]) if query_lower in haystack]
+
+
+def fetch_all_feeds(feed_urls: List[str], max_workers: int = 8) -> List[FeedItems]:
+    """
+    Fetch several feeds concurrently.
+
+    Fetching is I/O-bound, so a small thread pool lets the requests overlap
+    instead of waiting for each feed in turn.
+
+    Returns one FeedItems per feed, in the same order as `feed_urls`.
+    """
+    if not feed_urls:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(feed_urls))) as executor:
+        return list(executor.map(fetch_feed_items, feed_urls))
+
+
+def _fetch_page_text_safe(url: str) -> Tuple[str, Optional[Exception]]:
+    try:
+        return fetch_page_text(url), None
+    except Exception as e:
+        return "", e
+
+
+def fetch_all_page_texts(
+    urls: List[str], max_workers: int = 8
+) -> List[Tuple[str, Optional[Exception]]]:
+    """
+    Fetch several article pages concurrently.
+
+    Returns one (text, error) pair per URL, in the same order as `urls`.
+    Empty URLs are skipped and give ("", None).
+    """
+    results: List[Tuple[str, Optional[Exception]]] = [("", None)] * len(urls)
+    indexed = [(i, url) for i, url in enumerate(urls) if url]
+    if not indexed:
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(indexed))) as executor:
+        fetched = executor.map(_fetch_page_text_safe, [url for _, url in indexed])
+        for (i, _), result in zip(indexed, fetched):
+            results[i] = result
+
+    return results
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description=(
@@ -118,22 +268,16 @@ def main() -> None:
         raise SystemExit("Error: query must not be empty.")
 
     # Collect items from all feeds
-    all_items: List[Dict[str, str]] = []
-    for feed_url in RSS_FEEDS:
-        print(f"- Fetching feed: {feed_url}")
-        feed_items = fetch_feed_items(feed_url)
-        print(f"  -> {len(feed_items)} items retrieved")
-        all_items.extend(feed_items)
+    feeds = fetch_all_feeds(RSS_FEEDS)
+    for feed_url, feed_items in zip(RSS_FEEDS, feeds):
+        print(f"- Fetched feed: {feed_url}")
+        print(f"  -> {len(feed_items['titles'])} items retrieved")
+    all_items = merge_feed_items(feeds)
 
-    print(f"\nTotal items from all feeds: {len(all_items)}")
+    print(f"\nTotal items from all feeds: {len(all_items['titles'])}")
 
-    # Filter items whose title or description contains the query (case-insensitive)
-    query_lower = query.lower()
-    matching_items: List[Dict[str, str]] = []
-    for item in all_items:
-        haystack = (item.get("title", "") + " " + item.get("description", "")).lower()
-        if query_lower in haystack:
-            matching_items.append(item)
+    # Indices of items whose title or description contains the query (case-insensitive)
+    matching_items = filter_items(all_items, query)
 
     if not matching_items:
         print(f"\nNo items matched query {query!r}.")
@@ -144,10 +288,15 @@ def main() -> None:
 
     summariser = NewsSummariser()
 
-    # Limit to max_articles
-    for i, item in enumerate(matching_items[:max_articles], start=1):
-        title = item.get("title", "").strip()
-        link = item.get("link", "").strip()
+    # Limit to max_articles, and download their pages concurrently up front
+    selected_items = matching_items[:max_articles]
+    links = [all_items["links"][idx].strip() for idx in selected_items]
+    page_results = fetch_all_page_texts(links)
+
+    for i, (idx, link, (page_text, fetch_error)) in enumerate(
+        zip(selected_items, links, page_results), start=1
+    ):
+        title = all_items["titles"][idx].strip()
 
         print(f"================ Article {i} ================")
         print(f"Title: {title}")
@@ -158,10 +307,8 @@ def main() -> None:
             print("No link available; skipping summarisation.\n")
             continue
 
-        try:
-            page_text = fetch_page_text(link)
-        except Exception as e:
-            print(f"Error fetching article text: {e}\n")
+        if fetch_error is not None:
+            print(f"Error fetching article text: {fetch_error}\n")
             continue
 
         if not page_text:
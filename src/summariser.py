@@ -1,9 +1,70 @@
 # src/summariser.py
 
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List
+from functools import cached_property
+from typing import List, Literal, Optional, Tuple
 
+import torch
 from transformers import pipeline
+from transformers.modeling_outputs import BaseModelOutput
+
+
+# Opt-in: route short inputs to a smaller, faster model.
+# Enable with NEWS_TLDR_ROUTE_BY_LENGTH=1.
+ROUTE_BY_LENGTH = os.environ.get("NEWS_TLDR_ROUTE_BY_LENGTH", "") == "1"
+SHORT_MODEL_NAME = "sshleifer/distilbart-cnn-6-6"
+SHORT_INPUT_CHARS = 1500  # inputs shorter than this use the short model
+
+# One bullet per non-empty line, without any leading "-", "•" or "*".
+_BULLET_RE = re.compile(r"^\s*[-•*]?\s*(.+?)\s*$", re.MULTILINE)
+# Sentence boundaries: whitespace following a full stop.
+_SENT_RE = re.compile(r"(?<=\.)\s+")
+
+# Decoder prompt for the bullet-point generation: the summary is forced to
+# start with a bullet marker, steering it towards a list of short points.
+_BULLET_DECODER_PROMPT = "-"
+
+
+def _configure_cpu_threads() -> None:
+    """
+    Cap PyTorch's intra-op thread pool at all but one of the CPUs available
+    to this process (leaving one for the UI / network threads), never above
+    torch's own default, and make sure the oneDNN (MKL-DNN) kernels are
+    enabled. Respects OMP_NUM_THREADS if the user has set it.
+    """
+    torch.backends.mkldnn.enabled = True
+
+    if "OMP_NUM_THREADS" in os.environ:
+        return
+
+    # CPUs this process may actually run on (respects affinity / cpusets);
+    # os.cpu_count() would count every logical CPU on the host.
+    if hasattr(os, "sched_getaffinity"):
+        available = len(os.sched_getaffinity(0))
+    else:
+        available = os.cpu_count() or 1
+
+    # Torch already defaults to the number of physical cores; only ever lower
+    # that, so SMT siblings and CPU-limited containers aren't oversubscribed.
+    torch.set_num_threads(max(1, min(torch.get_num_threads(), available - 1)))
+    try:
+        # Generation runs one op at a time, so a single inter-op thread is enough.
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Can only be set once, before any inter-op parallel work has started.
+        pass
+
+
+# How bullet points are produced:
+#   "model"     - a second decoder run from a bullet-style prompt (best quality)
+#   "sentences" - split the TL;DR into sentences (skips the second decoder run)
+#   "off"       - no bullet points
+BulletsMode = Literal["model", "sentences", "off"]
 
 
 @dataclass
@@ -24,33 +85,199 @@ class NewsSummariser:
         self,
         model_name: str = "sshleifer/distilbart-cnn-12-6",
         device: int = -1,  # -1 = CPU, 0 = first GPU if you have one
+        cache_size: int = 512,
+        quantize: bool = True,  # int8 dynamic quantisation (CPU only)
+        route_by_length: bool = ROUTE_BY_LENGTH,
+        warmup: bool = False,  # worth it for long-lived processes (Streamlit)
     ) -> None:
+        self._device = device
+        self._quantize = quantize
+        self._route_by_length = route_by_length
+
+        if device < 0:
+            _configure_cpu_threads()
+
         # Create a summarisation pipeline using a pre-trained model.
         # This is loaded once when you create the NewsSummariser.
-        self._summariser = pipeline(
+        self._summariser = self._load_pipeline(model_name)
+
+        # Small LRU cache of raw model outputs, keyed by
+        # (text hash, max_tokens, whether bullets were generated).
+        # The same article is often summarised again (Streamlit reruns, or the
+        # same feed item matching several queries), so we skip the model then.
+        self._cache: "OrderedDict[Tuple[str, int, bool], Tuple[str, str]]" = OrderedDict()
+        self._cache_size = cache_size
+        # One instance is shared by all Streamlit sessions (each runs in its
+        # own thread), so cache reads and writes go through this lock.
+        self._cache_lock = threading.Lock()
+
+        # Run one tiny generation now so kernel set-up and allocator warm-up
+        # happen at load time rather than on the first real request.
+        if warmup:
+            try:
+                self._generate(self._summariser, "Warm-up.", max_tokens=10)
+            except Exception as e:
+                print(f"[warning] Model warm-up failed: {e}")
+
+    def _load_pipeline(self, model_name: str):
+        summariser = pipeline(
             "summarization",
             model=model_name,
             tokenizer=model_name,
-            device=device,
+            device=self._device,
         )
 
-    def summarise(self, text: str, max_chars: int = 300) -> SummaryResult:
+        # On CPU, quantise the Linear layers (the bulk of the model) to int8.
+        # This roughly halves memory traffic and lets PyTorch use its fast
+        # int8 matmul kernels, with very little change in summary quality.
+        # If this torch build no longer offers dynamic quantisation, keep FP32.
+        if self._quantize and self._device < 0:
+            try:
+                summariser.model = torch.ao.quantization.quantize_dynamic(
+                    summariser.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            except (AttributeError, RuntimeError) as e:
+                print(f"[warning] int8 quantisation unavailable, using FP32 model: {e}")
+
+        return summariser
+
+    @cached_property
+    def _short_summariser(self):
+        # Only loaded the first time a short input comes in.
+        return self._load_pipeline(SHORT_MODEL_NAME)
+
+    def _pick_pipeline(self, text: str):
+        """
+        Pick the smaller model for short inputs (most RSS articles) when
+        length routing is enabled; otherwise use the main model.
+        """
+        if self._route_by_length and len(text) < SHORT_INPUT_CHARS:
+            return self._short_summariser
+        return self._summariser
+
+    def _generate(
+        self, summariser, text: str, max_tokens: int, with_bullets: bool = True
+    ) -> Tuple[str, str]:
+        """
+        Run the given pipeline's model and return the raw (tldr, bullets_text)
+        outputs.
+
+        The text is tokenised once and truncated by tokens, so the model's
+        whole input window is used. The encoder then runs once over the
+        article, and its output is shared by two decoder runs: a plain one
+        for the TL;DR and one that starts from a bullet-style decoder prompt.
+        With `with_bullets=False` the second run is skipped and bullets_text
+        is empty.
+        """
+        tokenizer = summariser.tokenizer
+        model = summariser.model
+
+        # Same preprocessing as the pipeline: the model's task prefix (e.g.
+        # "summarize: " for T5) plus truncation to the tokenizer's limit
+        # (truncation=True without max_length uses tokenizer.model_max_length,
+        # and doesn't overflow when a tokenizer leaves that unset).
+        encoded = tokenizer(
+            (summariser.prefix or "") + text,
+            truncation=True,
+            return_tensors="pt",
+        ).to(summariser.device)
+        input_ids = encoded.input_ids
+        attention_mask = encoded.attention_mask
+
+        # Bullet decoder prompt: <decoder start>, then the BOS token if the
+        # model forces one as its first output (BART does; T5/Pegasus don't),
+        # followed by the bullet marker.
+        prompt_ids = [model.config.decoder_start_token_id]
+        forced_bos_token_id = summariser.generation_config.forced_bos_token_id
+        if forced_bos_token_id is not None:
+            prompt_ids.append(forced_bos_token_id)
+        prompt_ids += tokenizer(_BULLET_DECODER_PROMPT, add_special_tokens=False).input_ids
+        bullet_prompt = torch.tensor([prompt_ids], device=summariser.device)
+
+        with torch.no_grad():
+            encoder_hidden = model.get_encoder()(
+                input_ids=input_ids, attention_mask=attention_mask
+            ).last_hidden_state
+
+            tldr_ids = self._decode(
+                summariser, encoder_hidden, attention_mask, max_tokens=max_tokens
+            )
+            tldr = tokenizer.decode(
+                tldr_ids[0], skip_special_tokens=True, clean_up_tokenization_spaces=False
+            ).strip()
+            if not with_bullets:
+                return tldr, ""
+
+            bullet_ids = self._decode(
+                summariser,
+                encoder_hidden,
+                attention_mask,
+                max_tokens=max_tokens,
+                decoder_input_ids=bullet_prompt,
+            )
+
+        # Drop the forced prompt tokens; only keep what the model wrote.
+        bullets_text = tokenizer.decode(
+            bullet_ids[0, bullet_prompt.shape[1]:],
+            skip_special_tokens=True,
+            clean_up_tokenization_spaces=False,
+        )
+
+        return tldr, bullets_text.strip()
+
+    @staticmethod
+    def _decode(
+        summariser,
+        encoder_hidden: torch.Tensor,
+        attention_mask: torch.Tensor,
+        max_tokens: int,
+        decoder_input_ids: Optional[torch.Tensor] = None,
+    ) -> torch.Tensor:
+        """
+        Generate from precomputed encoder states. Length limits apply to the
+        generated tokens, on top of any decoder prompt.
+        """
+        prompt_len = decoder_input_ids.shape[1] if decoder_input_ids is not None else 1
+        return summariser.model.generate(
+            # generate() expands these in place for beam search, so each call
+            # gets its own wrapper around the shared hidden states.
+            encoder_outputs=BaseModelOutput(last_hidden_state=encoder_hidden),
+            attention_mask=attention_mask,
+            decoder_input_ids=decoder_input_ids,
+            max_length=max_tokens + prompt_len - 1,
+            min_length=max_tokens // 4 + prompt_len - 1,
+            do_sample=False,  # deterministic
+            generation_config=summariser.generation_config,  # same defaults as the pipeline
+        )
+
+    def summarise(
+        self, text: str, max_chars: int = 300, bullets_mode: BulletsMode = "model"
+    ) -> SummaryResult:
         """
         Summarise the given text into:
           - a TL;DR paragraph (using the transformer model)
-          - dummy bullet points (for now)
+          - up to 5 bullet points (see BulletsMode for how they are made)
 
         max_chars here is an approximate control on length;
         we convert it into a rough token limit.
+
+        bullets_mode="sentences" is faster than "model": it skips the second
+        decoder run (the encoder pass is shared either way) and uses the
+        TL;DR's sentences as the bullets.
         """
+        if bullets_mode not in ("model", "sentences", "off"):
+            raise ValueError(
+                f"bullets_mode must be 'model', 'sentences' or 'off', got {bullets_mode!r}"
+            )
+
         text = text.strip()
 
         if not text:
             return SummaryResult(tldr="", bullet_points=[])
 
-        # For now, if the text is extremely long, truncate it so the model doesn't choke.
-        # Later we can add a smarter "chunking" strategy.
-        max_input_chars = 4000  # arbitrary for now
+        # The model input is truncated by tokens in _generate; this cheap cut
+        # just avoids tokenising far more text than could ever fit.
+        max_input_chars = 12000
         if len(text) > max_input_chars:
             text = text[:max_input_chars]
 
@@ -58,53 +285,49 @@ class NewsSummariser:
         # We map max_chars to a max_length in tokens.
         max_tokens = max(50, min(200, max_chars))  # keep it in a safe range
 
-        # Call the transformer summarisation pipeline for the TL;DR
-        summary_output = self._summariser(
-            text,
-            max_length=max_tokens,
-            min_length=max_tokens // 4,
-            do_sample=False,  # deterministic
-            truncation=True,  # safely cut inputs that are too long
-
-        )
+        text_hash = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        with_bullets = bullets_mode == "model"
+        cache_key = (text_hash, max_tokens, with_bullets)
 
-        # The pipeline returns a list of dicts; we take the first one
-        tldr = summary_output[0]["summary_text"].strip()
+        # A cached run with bullets also holds the TL;DR, so it can serve a
+        # "sentences"/"off" request too.
+        lookup_keys = [cache_key]
+        if not with_bullets:
+            lookup_keys.insert(0, (text_hash, max_tokens, True))
 
-        # Now generate bullet points using a second call.
-        # We tell the model explicitly what format we want.
-        bullet_prompt = (
-            "Summarise the following text into 3–5 short bullet points. "
-            "Return them as separate lines, each starting with a dash '-'.\n\n"
-            + text
-        )
-
-        bullets_output = self._summariser(
-            bullet_prompt,
-            max_length=max_tokens,
-            min_length=max_tokens // 4,
-            do_sample=False,
-            truncation=True,  # safely cut inputs that are too long
+        cached = None
+        with self._cache_lock:
+            for key in lookup_keys:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    break
 
-        )
+        if cached is not None:
+            tldr, bullets_text = cached
+        else:
+            tldr, bullets_text = self._generate(
+                self._pick_pipeline(text), text, max_tokens, with_bullets=with_bullets
+            )
+            with self._cache_lock:
+                self._cache[cache_key] = (tldr, bullets_text)
+                self._cache.move_to_end(cache_key)
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)  # drop the least recently used
 
-        bullets_text = bullets_output[0]["summary_text"].strip()
+        if bullets_mode == "off":
+            return SummaryResult(tldr=tldr, bullet_points=[])
+        if bullets_mode == "sentences":
+            # Derive the bullets from the TL;DR instead of a second decoder run.
+            bullets_text = tldr
 
         # Parse the model output into a list of bullet strings.
-        bullet_lines = []
-        for line in bullets_text.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            # Remove leading bullet characters like "-", "•", etc.
-            if line[0] in "-•*":
-                line = line[1:].strip()
-            bullet_lines.append(line)
+        bullet_lines = _BULLET_RE.findall(bullets_text)
 
         # Fallback: if model didn't break into lines, split by sentences.
         if len(bullet_lines) <= 1:
-            parts = bullets_text.replace("•", "").split(". ")
-            bullet_lines = [p.strip().strip(".") for p in parts if p.strip()]
+            parts = _SENT_RE.split(bullets_text.replace("•", ""))
+            bullet_lines = [p.strip(" .") for p in parts if p.strip(" .")]
 
         # Keep at most 5 bullet points
         bullet_points = bullet_lines[:5]